@@ -1,3 +1,26 @@
-from .core import HHUpdater
+from typing import TYPE_CHECKING , Any
 
-__all__ = [ 'HHUpdater' ]
+if TYPE_CHECKING :
+	from .core import HHUpdater
+	from .core_async import AsyncHHUpdater
+
+__all__ = [ 'HHUpdater' , 'AsyncHHUpdater' ]
+
+
+def __getattr__ ( name: str ) -> Any :
+	"""
+	Ленивый импорт классов пакета (PEP 562).
+
+	Пакет импортируется и при запуске CLI (python -m hh_updater), поэтому httpx
+	загружается только при первом обращении к HHUpdater/AsyncHHUpdater, а не ради --help.
+	"""
+
+	if name == 'HHUpdater' :
+		from .core import HHUpdater
+		return HHUpdater
+
+	if name == 'AsyncHHUpdater' :
+		from .core_async import AsyncHHUpdater
+		return AsyncHHUpdater
+
+	raise AttributeError ( f"module {__name__!r} has no attribute {name!r}" )
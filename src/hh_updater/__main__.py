@@ -1,17 +1,35 @@
-from datetime import datetime
-from typing import List
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING , List , Optional
 
 import typer
 
-# Импортируем наш класс HHUpdater
-# Предполагается, что класс HHUpdater находится в файле hhupdater.py
-from hh_updater import HHUpdater
+# Классы HHUpdater/AsyncHHUpdater (и вместе с ними httpx) импортируются внутри команд,
+# чтобы --help и разбор аргументов не тратили время на загрузку HTTP-стека
+if TYPE_CHECKING :
+	from hh_updater import AsyncHHUpdater
 
 verbose: bool = False
-base_url: str = "https://hh.ru"
+DEFAULT_BASE_URL: str = "https://hh.ru"
+base_url: str = DEFAULT_BASE_URL
 login: str | None = None
 password: str | None = None
 
+# UNIX-сокет, через который команда update передает ID резюме процессу daemon
+SOCKET_PATH: Path = Path.home ( ) / '.cache' / 'hh-updater' / 'sock'
+# Сколько секунд update --daemon ждет ответа. Один проход обновления может ждать Retry-After
+# до (TOUCH_ATTEMPTS - 1) * RETRY_AFTER_MAX = 180 секунд, а при повторной авторизации проходов два,
+# поэтому запас взят с избытком; зависший daemon при этом не блокирует вызов навсегда
+DAEMON_TIMEOUT: float = 600.0
+# Сколько секунд daemon тратит на запрос, включая ожидание своей очереди: меньше DAEMON_TIMEOUT,
+# чтобы клиент получил ответ "fail" раньше, чем перестанет его ждать
+DAEMON_REPLY_TIMEOUT: float = DAEMON_TIMEOUT - 30.0
+
+# Вывод в терминал: если stdout перенаправлен (CI, файл), сообщения не раскрашиваются
+_IS_TTY: bool = sys.stdout.isatty ( )
+
 # Создаем экземпляр Typer приложения
 app = typer.Typer (
 	no_args_is_help = True ,
@@ -26,10 +44,12 @@ def main (
 		_verbose: bool = typer.Option ( verbose , "--verbose" , "-v" , help = "Подробный вывод" ) ,
 		_base_url: str = typer.Option ( base_url , "--url" ,
 		                                help = "Базовый URL HH.ru (можно изменить для тестирования)" ) ,
-		_login: str = typer.Option ( ... , "--login" , prompt = True , hide_input = False ,
-		                             help = "Логин (email) от аккаунта HH.ru" ) ,
-		_password: str = typer.Option ( ... , "--password" , prompt = True , hide_input = True ,
-		                                help = "Пароль от аккаунта HH.ru" ) ,
+		# Логин и пароль нужны только командам, которые входят в аккаунт: они запрашивают их сами,
+		# поэтому "update --daemon" и "check" работают без них, а пароль можно не указывать в командной строке
+		_login: Optional [ str ] = typer.Option ( None , "--login" , envvar = "HH_LOGIN" ,
+		                                         help = "Логин (email) от аккаунта HH.ru" ) ,
+		_password: Optional [ str ] = typer.Option ( None , "--password" , envvar = "HH_PASSWORD" ,
+		                                            help = "Пароль от аккаунта HH.ru" ) ,
 ) :
 	"""
 	CLI инструмент для автоматического обновления резюме на HH.ru
@@ -44,24 +64,45 @@ def main (
 	password = _password or None
 
 
+def format_success ( message: str ) -> str :
+	"""Утилита для оформления успешных сообщений"""
+	text = f"✓ {message}"
+	return typer.style ( text , fg = typer.colors.GREEN ) if _IS_TTY else text
+
+
+def format_error ( message: str ) -> str :
+	"""Утилита для оформления сообщений об ошибках"""
+	text = f"✗ {message}"
+	return typer.style ( text , fg = typer.colors.RED ) if _IS_TTY else text
+
+
+def format_info ( message: str ) -> str :
+	"""Утилита для оформления информационных сообщений"""
+	text = f"ℹ {message}"
+	return typer.style ( text , fg = typer.colors.BLUE ) if _IS_TTY else text
+
+
 def print_success ( message: str ) :
 	"""Утилита для вывода успешных сообщений"""
-	typer.echo ( typer.style ( f"✓ {message}" , fg = typer.colors.GREEN ) )
+	typer.echo ( format_success ( message ) )
 
 
 def print_error ( message: str ) :
 	"""Утилита для вывода сообщений об ошибках"""
-	typer.echo ( typer.style ( f"✗ {message}" , fg = typer.colors.RED ) )
+	typer.echo ( format_error ( message ) )
 
 
 def print_info ( message: str ) :
 	"""Утилита для вывода информационных сообщений"""
-	typer.echo ( typer.style ( f"ℹ {message}" , fg = typer.colors.BLUE ) )
+	typer.echo ( format_info ( message ) )
 
 
 @app.command ( )
 def update (
 		cv_ids: List [ str ] = typer.Argument ( ... , help = "Список ID резюме для обновления" ) ,
+		use_daemon: bool = typer.Option ( False , "--daemon" ,
+		                                  help = "Передать резюме запущенному процессу hh-updater daemon" ) ,
+		socket_path: Path = typer.Option ( SOCKET_PATH , "--socket" , help = "UNIX-сокет процесса daemon" ) ,
 ) :
 	"""
 	Обновить указанные резюме на HH.ru
@@ -75,55 +116,272 @@ def update (
 		print_info ( f"Используем базовый URL: {base_url}" )
 		print_info ( f"Резюме для обновления: {', '.join ( cv_ids )}" )
 
-	start_time = datetime.now ( )
+	if use_daemon :
+		# Процесс daemon уже вошел в аккаунт со своими настройками
+		if base_url != DEFAULT_BASE_URL :
+			print_info ( "Параметр --url игнорируется: используется URL процесса daemon" )
+	else :
+		_ask_credentials ( )
+
+	# Монотонные часы не зависят от перевода системного времени во время работы.
+	# Отсчет начинается после ввода логина и пароля, чтобы не учитывать время набора
+	start_time = time.perf_counter ( )
 
 	try :
-		# Используем контекстный менеджер для автоматического управления соединением
-		with HHUpdater ( base_url ) as updater :
-			if verbose :
-				print_info ( "Получаем XSRF токен..." )
+		if use_daemon :
+			results = _send_to_daemon ( socket_path , cv_ids )
+		else :
+			results = asyncio.run ( _run ( cv_ids ) )
 
-			# Авторизуемся на HH.ru
-			if verbose :
-				print_info ( "Выполняем авторизацию..." )
+	except typer.Exit :
+		# Ошибка авторизации уже выведена в _auth
+		raise
 
-			auth_success = updater.auth ( login , password )
+	except Exception as e :
+		print_error ( f"Произошла непредвиденная ошибка: {str ( e )}" )
+		if verbose :
+			import traceback
+			typer.echo ( traceback.format_exc ( ) )
+		raise typer.Exit ( code = 1 )
 
-			if not auth_success :
-				print_error ( "Ошибка авторизации. Проверьте логин и пароль." )
-				raise typer.Exit ( code = 1 )
+	_report ( cv_ids , results , start_time )
 
-			print_success ( "Авторизация прошла успешно!" )
 
-			# Обновляем каждое резюме
-			success_count = 0
-			for cv_id in cv_ids :
-				if verbose :
-					print_info ( f"Обновляем резюме {cv_id}..." )
+def _ask_credentials ( ) -> None :
+	"""
+	Запрос логина и пароля, не переданных через --login/--password или HH_LOGIN/HH_PASSWORD.
+	"""
 
-				if updater.update_cv ( cv_id ) :
-					print_success ( f"Резюме {cv_id} успешно обновлено!" )
-					success_count += 1
-				else :
-					print_error ( f"Не удалось обновить резюме {cv_id}" )
+	global login , password
+	if not login :
+		login = typer.prompt ( "Login" )
+	if not password :
+		password = typer.prompt ( "Password" , hide_input = True )
 
-			# Выводим итоговую статистику
-			end_time = datetime.now ( )
-			duration = (end_time - start_time).total_seconds ( )
 
-			print_success ( f"Обновлено {success_count} из {len ( cv_ids )} резюме за {duration:.2f} секунд" )
+async def _auth ( updater: "AsyncHHUpdater" ) -> None :
+	"""
+	Авторизация на HH.ru с выводом результата; при ошибке завершает команду с кодом 1.
+	"""
 
-			if success_count < len ( cv_ids ) :
-				raise typer.Exit ( code = 1 )
+	if verbose :
+		print_info ( "Выполняем авторизацию..." )
 
-	except Exception as e :
-		print_error ( f"Произошла непредвиденная ошибка: {str ( e )}" )
+	if not await updater.auth ( login , password ) :
+		print_error ( "Ошибка авторизации. Проверьте логин и пароль." )
+		raise typer.Exit ( code = 1 )
+
+	print_success ( "Авторизация прошла успешно!" )
+
+
+async def _touch_all ( updater: "AsyncHHUpdater" , cv_ids: List [ str ] ) -> List [ object ] :
+	"""
+	Параллельное обновление резюме через AsyncHHUpdater.
+
+	Запросы на обновление запускаются через asyncio.gather (не более MAX_CONNECTIONS одновременно),
+	поэтому общее время определяется самыми медленными запросами, а не их суммой.
+	Если сервер отверг сессию (см. AsyncHHUpdater.needs_relogin), выполняется повторная
+	авторизация и неудачные запросы повторяются; частота входов по паролю ограничена RELOGIN_INTERVAL.
+
+	Returns:
+			List[object]: Результат для каждого резюме - True, False или исключение
+	"""
+
+	from hh_updater.core import MAX_CONNECTIONS
+
+	# Ограничиваем число одновременных запросов, чтобы не упереться в пул соединений
+	# и не попасть под ограничение частоты запросов HH.ru
+	semaphore = asyncio.Semaphore ( MAX_CONNECTIONS )
+
+	async def touch ( cv_id: str ) -> bool :
+		async with semaphore :
+			return await updater.update_cv ( cv_id )
+
+	if verbose :
+		print_info ( f"Обновляем {len ( cv_ids )} резюме..." )
+
+	# Обновляем все резюме параллельно; исключения возвращаются как результаты,
+	# чтобы сбой одного запроса не отменял остальные
+	results = await asyncio.gather (
+		*[ touch ( cv_id ) for cv_id in cv_ids ] ,
+		return_exceptions = True
+	)
+
+	failed = [ index for index , result in enumerate ( results ) if result is not True ]
+	if failed and updater.needs_relogin ( ) :
 		if verbose :
-			import traceback
-			typer.echo ( traceback.format_exc ( ) )
+			print_info ( "Сессия недействительна, выполняем авторизацию заново..." )
+
+		updater.invalidate_session ( )
+		await _auth ( updater )
+
+		retried = await asyncio.gather (
+			*[ touch ( cv_ids [ index ] ) for index in failed ] ,
+			return_exceptions = True
+		)
+		for index , result in zip ( failed , retried ) :
+			results [ index ] = result
+
+	return results
+
+
+async def _run ( cv_ids: List [ str ] ) -> List [ object ] :
+	"""
+	Авторизация и параллельное обновление резюме в рамках одного запуска.
+	"""
+
+	from hh_updater import AsyncHHUpdater
+	from hh_updater.core import SESSION_PATH
+
+	# Используем контекстный менеджер для автоматического управления соединением
+	# CLI сохраняет сессию между запусками, чтобы не выполнять вход при каждом вызове
+	async with AsyncHHUpdater ( base_url , session_path = SESSION_PATH ) as updater :
+		await _auth ( updater )
+
+		return await _touch_all ( updater , cv_ids )
+
+
+def _report ( cv_ids: List [ str ] , results: List [ object ] , start_time: float ) -> None :
+	"""
+	Вывод результатов обновления; если часть резюме не обновлена, завершает команду с кодом 1.
+	"""
+
+	# Собираем отчет по всем резюме и выводим его одной записью в терминал
+	lines: List [ str ] = [ ]
+	for cv_id , result in zip ( cv_ids , results ) :
+		if result is True :
+			lines.append ( format_success ( f"Резюме {cv_id} успешно обновлено!" ) )
+		elif isinstance ( result , BaseException ) :
+			lines.append ( format_error ( f"Не удалось обновить резюме {cv_id}: {result}" ) )
+		else :
+			lines.append ( format_error ( f"Не удалось обновить резюме {cv_id}" ) )
+
+	typer.echo ( "\n".join ( lines ) )
+
+	success_count = sum ( 1 for result in results if result is True )
+
+	# Выводим итоговую статистику
+	duration = time.perf_counter ( ) - start_time
+
+	print_success ( f"Обновлено {success_count} из {len ( cv_ids )} резюме за {duration:.2f} секунд" )
+
+	if success_count < len ( cv_ids ) :
 		raise typer.Exit ( code = 1 )
 
 
+def _send_to_daemon ( path: Path , cv_ids: List [ str ] ) -> List [ object ] :
+	"""
+	Передача ID резюме процессу daemon через UNIX-сокет.
+
+	Протокол: клиент отправляет ID через перевод строки и закрывает запись,
+	daemon отвечает строкой "<ID> ok" или "<ID> fail" для каждого резюме.
+	"""
+
+	import socket
+
+	with socket.socket ( socket.AF_UNIX , socket.SOCK_STREAM ) as sock :
+		sock.settimeout ( DAEMON_TIMEOUT )
+		sock.connect ( str ( path ) )
+		sock.sendall ( "\n".join ( cv_ids ).encode ( ) )
+		sock.shutdown ( socket.SHUT_WR )
+
+		chunks: List [ bytes ] = [ ]
+		while chunk := sock.recv ( 4096 ) :
+			chunks.append ( chunk )
+
+	answers: dict [ str , bool ] = { }
+	for line in b"".join ( chunks ).decode ( ).splitlines ( ) :
+		cv_id , _ , status = line.rpartition ( ' ' )
+		answers [ cv_id ] = status == 'ok'
+
+	return [ answers.get ( cv_id , False ) for cv_id in cv_ids ]
+
+
+@app.command ( )
+def daemon (
+		socket_path: Path = typer.Option ( SOCKET_PATH , "--socket" , help = "UNIX-сокет для приема ID резюме" ) ,
+) :
+	"""
+	Запустить фоновый процесс, обновляющий резюме по запросам через UNIX-сокет
+
+	Процесс авторизуется один раз и держит соединение с HH.ru открытым,
+	поэтому последующие вызовы "hh-updater update --daemon ..." не тратят время
+	на запуск HTTP-клиента, TLS-рукопожатие и вход в аккаунт.
+	"""
+
+	_ask_credentials ( )
+
+	try :
+		asyncio.run ( _serve ( socket_path ) )
+
+	except KeyboardInterrupt :
+		print_info ( "Процесс остановлен" )
+
+
+async def _serve ( path: Path ) -> None :
+	"""
+	Авторизация и обработка запросов на обновление резюме из UNIX-сокета.
+	"""
+
+	from hh_updater import AsyncHHUpdater
+	from hh_updater.core import SESSION_PATH
+
+	# CLI сохраняет сессию между запусками, чтобы не выполнять вход при каждом вызове
+	async with AsyncHHUpdater ( base_url , session_path = SESSION_PATH ) as updater :
+		await _auth ( updater )
+
+		# Запросы обрабатываются по одному, чтобы повторная авторизация не выполнялась параллельно
+		lock = asyncio.Lock ( )
+
+		async def handle ( reader: asyncio.StreamReader , writer: asyncio.StreamWriter ) -> None :
+			cv_ids = (await reader.read ( )).decode ( ).split ( )
+
+			try :
+				async with asyncio.timeout ( DAEMON_REPLY_TIMEOUT ) :
+					async with lock :
+						results = await _touch_all ( updater , cv_ids )
+			except TimeoutError :
+				print_error ( f"Запрос не обработан за {DAEMON_REPLY_TIMEOUT:.0f} секунд" )
+				results = [ False ] * len ( cv_ids )
+			except typer.Exit :
+				# Повторная авторизация не удалась - отвечаем клиенту неудачей, но продолжаем работу
+				results = [ False ] * len ( cv_ids )
+			except Exception as e :
+				# Сетевая или иная ошибка не должна оставлять клиента без ответа и останавливать daemon
+				print_error ( f"Ошибка при обработке запроса: {str ( e )}" )
+				if verbose :
+					import traceback
+					typer.echo ( traceback.format_exc ( ) )
+				results = [ False ] * len ( cv_ids )
+
+			try :
+				try :
+					writer.write ( "".join (
+						f"{cv_id} {'ok' if result is True else 'fail'}\n" for cv_id , result in zip ( cv_ids , results )
+					).encode ( ) )
+					await writer.drain ( )
+				finally :
+					writer.close ( )
+					await writer.wait_closed ( )
+			except ConnectionError :
+				# Клиент перестал ждать (например, по DAEMON_TIMEOUT) - ответ отправлять некому
+				print_error ( "Клиент отключился, не дождавшись ответа" )
+
+		# Сокет доступен только владельцу: через него можно управлять авторизованной сессией
+		path.parent.mkdir ( mode = 0o700 , parents = True , exist_ok = True )
+		path.unlink ( missing_ok = True )
+		server = await asyncio.start_unix_server ( handle , path = path )
+		path.chmod ( 0o600 )
+
+		print_info ( f"Ожидаем ID резюме на {path}" )
+
+		try :
+			async with server :
+				await server.serve_forever ( )
+		finally :
+			path.unlink ( missing_ok = True )
+
+
 @app.command ( )
 def check (
 		base_url: str = typer.Option ( "https://hh.ru" , help = "Базовый URL для проверки доступности" )
@@ -134,6 +392,8 @@ def check (
 	print_info ( f"Проверяем доступность {base_url}..." )
 
 	try :
+		from hh_updater import HHUpdater
+
 		with HHUpdater ( base_url ) as updater :
 			# Пытаемся получить XSRF токен - это проверит доступность сайта
 			xsrf = updater.get_xsrf ( )
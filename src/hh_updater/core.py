@@ -1,20 +1,365 @@
+import json
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any , Optional , Self
+from urllib.parse import urlencode
+
 import httpx
-from typing import Optional , Self
 
 # Общие HTTP-заголовки для имитации браузера при запросах к HH.ru
-# Эти заголовки помогают избежать блокировки и делают запросы более "человеческими"
-COMMON_HEADERS: dict [ str , str ] = {
+# Эти заголовки помогают избежать блокировки и делают запросы более "человеческими".
+# Собираются в httpx.Headers один раз при импорте, а не при создании каждого клиента.
+# Accept-Encoding не задаем: httpx сам указывает только те алгоритмы сжатия, которые может распаковать.
+# Connection тоже не задаем: в HTTP/2 такие заголовки запрещены (h2 отклоняет запрос),
+# а keep-alive и так обеспечивает пул соединений
+COMMON_HEADERS: httpx.Headers = httpx.Headers ( {
 	'User-Agent'      : 'Mozilla/5.0 (Windows NT 6.1; Win64; x64) AppleWebKit/537.36' ,
 	'Accept'          : 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8' ,
-	'Accept-Encoding' : 'gzip, deflate, br' ,
 	'Accept-Language' : 'ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7' ,
-	'Connection'      : 'keep-alive' ,
 	'DNT'             : '1'  # Do Not Track - указывает сайту, что мы не хотим отслеживания
+} )
+
+# Неизменная часть данных формы "касания" резюме; ID резюме добавляется при каждом запросе
+TOUCH_DATA: dict [ str , str ] = {
+	'undirectable' : 'true'  # Флаг, предотвращающий редирект
+}
+
+# Максимальное число одновременных запросов к HH.ru: больше не дает выигрыша,
+# но повышает риск попасть под ограничение частоты запросов (429)
+MAX_CONNECTIONS: int = 8
+
+# Лимиты пула соединений. При HTTP/2 все запросы к HH.ru мультиплексируются
+# в одном TLS-соединении, поэтому много соединений не требуется. Увеличенный keepalive_expiry
+# (по умолчанию в httpx 5 секунд) не дает соединению закрыться между запросами одного запуска
+CONNECTION_LIMITS: httpx.Limits = httpx.Limits (
+	max_keepalive_connections = MAX_CONNECTIONS ,
+	max_connections = MAX_CONNECTIONS ,
+	keepalive_expiry = 120.0
+)
+
+# Таймауты запросов: 10 секунд на операцию, 5 секунд на установку соединения
+CLIENT_TIMEOUT: httpx.Timeout = httpx.Timeout ( 10.0 , connect = 5.0 )
+
+# Число повторных попыток установить соединение (обрабатывается транспортом httpx)
+TRANSPORT_RETRIES: int = 3
+# Общие параметры HTTP-клиента и его транспорта (одинаковы для HHUpdater и AsyncHHUpdater):
+# HTTP/2, пул соединений, повтор неудачных попыток соединения, таймауты и поддержка редиректов
+CLIENT_OPTIONS: dict [ str , Any ] = {
+	'headers'          : COMMON_HEADERS ,
+	'follow_redirects' : True ,
+	'timeout'          : CLIENT_TIMEOUT
+}
+TRANSPORT_OPTIONS: dict [ str , Any ] = {
+	'http2'   : True ,
+	'limits'  : CONNECTION_LIMITS ,
+	'retries' : TRANSPORT_RETRIES
 }
 
+# Число попыток "касания" резюме при ответах 429/5xx и базовая задержка экспоненциального отката (в секундах)
+TOUCH_ATTEMPTS: int = 4
+TOUCH_BACKOFF: float = 0.25
+# Верхняя граница ожидания по заголовку Retry-After (в секундах)
+RETRY_AFTER_MAX: float = 60.0
+
+# Файл, в котором между запусками хранятся cookies авторизованной сессии
+SESSION_PATH: Path = Path.home ( ) / '.cache' / 'hh-updater' / 'session.json'
+# Время (в секундах), в течение которого сохраненная сессия считается актуальной
+SESSION_TTL: float = 6 * 60 * 60
+# Время (в секундах), в течение которого полученный XSRF-токен используется без повторного запроса
+XSRF_TTL: float = 60 * 60
+# Минимальный интервал (в секундах) между входами по паролю при истекшей сессии:
+# частые входы грозят капчей или блокировкой аккаунта
+RELOGIN_INTERVAL: float = 10 * 60
+
+
+def _should_retry ( status_code: int , / ) -> bool :
+	"""
+	Проверка, что ответ означает временный сбой: ограничение частоты запросов (429) или ошибку сервера (5xx).
+	"""
+
+	return status_code == 429 or status_code >= 500
+
+
+def _session_expired ( status_code: int , / ) -> bool :
+	"""
+	Проверка, что ответ на обновление резюме означает истекшую сессию:
+	401/403 или редирект (на страницу логина), который запрос с undirectable=true получать не должен.
+	"""
+
+	return status_code in (401 , 403) or 300 <= status_code < 400
+
+
+def _retry_delay ( retry_after: Optional [ str ] , attempt: int , / ) -> float :
+	"""
+	Задержка перед повторной попыткой (в секундах).
+
+	Если сервер указал Retry-After в секундах, используется он (не больше RETRY_AFTER_MAX),
+	иначе - экспоненциальный откат от TOUCH_BACKOFF.
+	"""
+
+	if retry_after and retry_after.isdigit ( ) :
+		return min ( float ( retry_after ) , RETRY_AFTER_MAX )
+
+	return TOUCH_BACKOFF * 2 ** attempt
+
+
+@lru_cache ( maxsize = 1024 )
+def _touch_body ( cv_id: str ) -> bytes :
+	"""
+	Тело формы "касания" резюме в виде готовых байт application/x-www-form-urlencoded.
+
+	Кешируется по ID резюме: при повторных обновлениях тех же резюме httpx не кодирует форму заново.
+	"""
+
+	return urlencode ( { 'resume' : cv_id } | TOUCH_DATA ).encode ( )
+
+
+def _read_session ( path: Path , base_url: str , login: str ) -> Optional [ dict [ str , Any ] ] :
+	"""
+	Чтение сохраненной сессии с диска.
+
+	Возвращает None, если файла нет, он устарел, поврежден
+	или относится к другому аккаунту либо другому базовому URL.
+	"""
+
+	try :
+		if time.time ( ) - path.stat ( ).st_mtime > SESSION_TTL :
+			return None
+		session: dict [ str , Any ] = json.loads ( path.read_text ( encoding = 'utf-8' ) )
+	except (OSError , ValueError) :
+		return None
+
+	# Корректный JSON другой структуры считается поврежденным файлом
+	if not isinstance ( session , dict ) or not isinstance ( session.get ( 'cookies' , [ ] ) , list ) :
+		return None
+
+	if session.get ( 'base_url' ) != base_url or session.get ( 'login' ) != login :
+		return None
+
+	return session
+
+
+def _write_session ( path: Path , base_url: str , login: str , xsrf: Optional [ str ] , cookies: httpx.Cookies ) -> None :
+	"""
+	Сохранение сессии на диск.
+
+	Файл содержит авторизационные cookies, поэтому создается с правами только для владельца.
+	"""
+
+	session: dict [ str , Any ] = {
+		'base_url' : base_url ,
+		'login'    : login ,
+		'xsrf'     : xsrf ,
+		# Cookie хранятся списком (имя, значение, домен, путь): имена могут повторяться для разных доменов
+		'cookies'  : [ (cookie.name , cookie.value , cookie.domain , cookie.path) for cookie in cookies.jar ]
+	}
+
+	path.parent.mkdir ( mode = 0o700 , parents = True , exist_ok = True )
+	fd: int = os.open ( path , os.O_WRONLY | os.O_CREAT | os.O_TRUNC , 0o600 )
+	with os.fdopen ( fd , 'w' , encoding = 'utf-8' ) as file :
+		json.dump ( session , file )
+
+
+def _restore_cookies ( session: dict [ str , Any ] , cookies: httpx.Cookies ) -> Optional [ str ] :
+	"""
+	Загрузка cookies из сохраненной сессии в cookie-jar клиента.
+
+	Returns:
+			Optional[str]: XSRF-токен сессии (из файла или из cookie _xsrf)
+	"""
+
+	for cookie in session.get ( 'cookies' , [ ] ) :
+		# Записи неверного вида (из поврежденного файла) пропускаются
+		if not (isinstance ( cookie , list ) and len ( cookie ) == 4 and all ( isinstance ( item , str ) for item in cookie )) :
+			continue
+		name , value , domain , path = cookie
+		cookies.set ( name , value , domain = domain , path = path )
+
+	xsrf: Any = session.get ( 'xsrf' )
+	return (xsrf if isinstance ( xsrf , str ) else None) or cookies.get ( '_xsrf' )
+
+
+class _SessionMixin :
+	"""
+	Общее для HHUpdater и AsyncHHUpdater состояние и логика, не зависящая от типа HTTP-клиента:
+	URL эндпоинтов, XSRF-токен и заголовки под него, данные форм и хранение сессии между запусками.
+
+	Работа с файлом сессии синхронная: это единичные мелкие операции с диском.
+	Наследник создает self.client и вызывает _init_state из своего __init__.
+	"""
+
+	# __slots__ ограничивает возможные атрибуты экземпляра, экономя память
+	# и предотвращая случайное создание новых атрибутов
+	__slots__ = (
+		'base_url' , 'client' , 'xsrf' , 'xsrf_exp' , 'session_path' , 'session_restored' , 'session_expired' ,
+		'last_login_at' , '_base_headers' , '_login_url' , '_back_url' , '_touch_url' , '_resume_url_prefix'
+	)
+
+	def _init_state ( self , base_url: str , session_path: Optional [ Path ] , / ) -> None :
+		"""
+		Инициализация общего состояния клиента.
+
+		Args:
+				base_url: Базовый URL HH.ru
+				session_path: Файл для сохранения сессии между запусками (None - не сохранять)
+		"""
+
+		# Убираем завершающий слеш для единообразия URL
+		self.base_url: str = base_url.rstrip ( '/' )
+		# XSRF-токен для защиты от межсайтовой подделки запросов (будет получен позже),
+		# момент (по time.monotonic), после которого его нужно запросить заново,
+		# и собранные под этот токен заголовки AJAX-запросов
+		self.xsrf: Optional [ str ] = None
+		self.xsrf_exp: float = 0.0
+		self._set_xsrf ( None )
+		# Полные URL эндпоинтов собираются один раз, а не f-строкой при каждом запросе.
+		# URL запросов хранятся уже разобранными httpx.URL, чтобы httpx не разбирал строку заново;
+		# backUrl и Referer - это содержимое формы и заголовка, поэтому они остаются строками
+		self._login_url: httpx.URL = httpx.URL ( f"{self.base_url}/account/login?backurl=%2F" )  # Страница логина
+		self._back_url: str = f"{self.base_url}/"  # URL для редиректа после входа
+		self._touch_url: httpx.URL = httpx.URL ( f"{self.base_url}/applicant/resumes/touch" )  # Эндпоинт обновления
+		self._resume_url_prefix: str = f"{self.base_url}/applicant/resumes/"  # Префикс страницы резюме (Referer)
+		# Путь к файлу сессии и признак того, что сессия была восстановлена с диска
+		self.session_path: Optional [ Path ] = session_path
+		self.session_restored: bool = False
+		# Признак того, что сервер отверг сессию при обновлении резюме,
+		# и момент (по time.monotonic) последней попытки входа по паролю (None - попыток еще не было)
+		self.session_expired: bool = False
+		self.last_login_at: Optional [ float ] = None
+
+	def _login_form ( self , login: str , password: str , / ) -> dict [ str , str ] :
+		"""
+		Данные формы авторизации.
+		"""
+
+		return {
+			'username' : login ,  # Логин пользователя
+			'password' : password ,  # Пароль пользователя
+			'backUrl'  : self._back_url ,  # URL для редиректа после успешного входа
+			'_xsrf'    : self.xsrf or '' ,  # XSRF-токен (защита от CSRF-атак)
+			'action'   : 'Войти'  # Текст кнопки отправки формы
+		}
+
+	def _logged_in ( self , login: str , / ) -> None :
+		"""
+		Фиксация успешного входа по паролю: сброс признака истекшей сессии и ее сохранение.
+		"""
+
+		self.session_expired = False
+		self.save_session ( login )
+
+	def needs_relogin ( self ) -> bool :
+		"""
+		Проверка, нужен ли повторный вход по паролю.
+
+		Вход нужен, только если сервер отверг сессию (401/403/редирект) и с последней попытки
+		входа по паролю (в том числе неудачной) прошло не меньше RELOGIN_INTERVAL.
+		Ошибочный ID резюме или устойчивые 5xx повторного входа не вызывают.
+		"""
+
+		if not self.session_expired :
+			return False
+
+		return self.last_login_at is None or time.monotonic ( ) - self.last_login_at >= RELOGIN_INTERVAL
+
+	def _touch_headers ( self , cv_id: str , / ) -> dict [ str , str ] :
+		"""
+		Заголовки запроса обновления резюме: заранее собранные AJAX-заголовки и страница-источник.
+		"""
+
+		return self._base_headers | { 'Referer' : self._resume_url_prefix + cv_id }
+
+	def _set_xsrf ( self , xsrf: Optional [ str ] , / ) -> Optional [ str ] :
+		"""
+		Установка XSRF-токена с отсчетом срока его жизни (XSRF_TTL) по монотонным часам.
+		"""
+
+		self.xsrf = xsrf
+		self.xsrf_exp = time.monotonic ( ) + XSRF_TTL
+		# Заголовки AJAX-запросов зависят только от токена, поэтому собираем их один раз при его смене
+		self._base_headers = {
+			'X-Xsrftoken'      : xsrf or '' ,  # XSRF-токен в заголовке (требуется HH.ru)
+			'X-Requested-With' : 'XMLHttpRequest' ,  # Указываем, что это AJAX-запрос
+			'Content-Type'     : 'application/x-www-form-urlencoded'  # Тело формы передается готовыми байтами
+		}
+
+		return xsrf
+
+	def _xsrf_valid ( self ) -> bool :
+		"""
+		Проверка, что XSRF-токен есть и срок его жизни не истек.
+
+		Если токена нет, но он уже лежит в cookie-jar клиента (пришел с предыдущим ответом),
+		он берется оттуда без дополнительного запроса страницы логина.
+		"""
+
+		if not self.xsrf :
+			self._set_xsrf ( self.client.cookies.get ( '_xsrf' ) )
+
+		return bool ( self.xsrf ) and time.monotonic ( ) < self.xsrf_exp
+
+	def load_session ( self , login: str , / ) -> bool :
+		"""
+		Восстановление сохраненной сессии для указанного логина.
+
+		Позволяет пропустить авторизацию (GET и POST страницы логина), если
+		с прошлого запуска прошло меньше SESSION_TTL секунд.
+
+		Args:
+				login: Логин, для которого была сохранена сессия
+
+		Returns:
+				bool: True если сессия восстановлена, иначе False
+		"""
+
+		if self.session_path is None :
+			return False
+
+		session: Optional [ dict [ str , Any ] ] = _read_session ( self.session_path , self.base_url , login )
+		if session is None :
+			return False
+
+		self._set_xsrf ( _restore_cookies ( session , self.client.cookies ) )
+		self.session_restored = self.xsrf is not None
+		self.session_expired = False
+
+		return self.session_restored
+
+	def save_session ( self , login: str , / ) -> None :
+		"""
+		Сохранение текущей сессии (cookies и XSRF-токена) на диск.
+
+		Args:
+				login: Логин, под которым выполнена авторизация
+		"""
+
+		if self.session_path is not None :
+			_write_session ( self.session_path , self.base_url , login , self.xsrf , self.client.cookies )
+
+	def invalidate_session ( self ) -> None :
+		"""
+		Сброс сессии: удаляет файл сессии и авторизационные cookies клиента.
+
+		Вызывается, когда восстановленная сессия оказалась недействительной.
+		XSRF-токен (и cookie _xsrf) сохраняется, чтобы повторный вход обошелся
+		одним POST-запросом без предварительного GET страницы логина; если сервер
+		отклонит токен (403), auth сам запросит новый.
+		"""
+
+		if self.session_path is not None :
+			self.session_path.unlink ( missing_ok = True )
+
+		for cookie in list ( self.client.cookies.jar ) :
+			if cookie.name != '_xsrf' :
+				self.client.cookies.delete ( cookie.name , domain = cookie.domain , path = cookie.path )
+
+		self.session_restored = False
+
 
 # noinspection GrazieInspection,SpellCheckingInspection
-class HHUpdater :
+class HHUpdater ( _SessionMixin ) :
 	"""
 	Класс для автоматизации работы с HH.ru: авторизация и обновление резюме.
 
@@ -22,25 +367,28 @@ class HHUpdater :
 	Реализует контекстный менеджер для безопасного управления HTTP-соединениями.
 	"""
 
-	# __slots__ ограничивает возможные атрибуты экземпляра, экономя память
-	# и предотвращая случайное создание новых атрибутов
-	__slots__ = ('base_url' , 'client' , 'xsrf')
+	# Все атрибуты экземпляра объявлены в __slots__ базового класса
+	__slots__ = ()
 
-	def __init__ ( self , base_url: str = 'https://hh.ru' , / ) -> None :
+	def __init__ ( self , base_url: str = 'https://hh.ru' , / , session_path: Optional [ Path ] = None ) -> None :
 		"""
 		Инициализация клиента для работы с HH.ru.
 
 		Args:
 				base_url: Базовый URL HH.ru (по умолчанию 'https://hh.ru')
 								 Символ / делает параметр позиционным - его нельзя передать по имени
+				session_path: Файл для сохранения сессии между запусками, например SESSION_PATH.
+								 По умолчанию None - сессия не сохраняется и auth всегда выполняет вход
 		"""
 
-		# Убираем завершающий слеш для единообразия URL
-		self.base_url: str = base_url.rstrip ( '/' )
-		# Создаем HTTP-клиент с общими заголовками и поддержкой редиректов
-		self.client: httpx.Client = httpx.Client ( headers = COMMON_HEADERS , follow_redirects = True )
-		# XSRF-токен для защиты от межсайтовой подделки запросов (будет получен позже)
-		self.xsrf: Optional [ str ] = None
+		# URL эндпоинтов, XSRF-токен и настройки сессии
+		self._init_state ( base_url , session_path )
+		# Создаем HTTP/2-клиент с общими заголовками и поддержкой редиректов
+		# Транспорт сам повторяет неудачные попытки установить соединение
+		self.client: httpx.Client = httpx.Client (
+			**CLIENT_OPTIONS ,
+			transport = httpx.HTTPTransport ( **TRANSPORT_OPTIONS )
+		)
 
 	def __enter__ ( self ) -> Self :
 		"""
@@ -79,13 +427,29 @@ class HHUpdater :
 				Optional[str]: XSRF-токен или None, если не удалось получить
 		"""
 
-		# Запрашиваем страницу логина, где в cookies будет XSRF-токен
-		response: httpx.Response = self.client.get ( f"{self.base_url}/account/login?backurl=%2F" )
+		# Запрашиваем страницу логина, где в cookies будет XSRF-токен.
+		# Cookies приходят в заголовках, поэтому тело страницы не читаем и не распаковываем
+		with self.client.stream ( 'GET' , self._login_url ) as response :
+			# Извлекаем токен из cookies ответа
+			return self._set_xsrf ( response.cookies.get ( '_xsrf' ) )
 
-		# Извлекаем токен из cookies ответа
-		self.xsrf = response.cookies.get ( '_xsrf' )
+	def _post_login ( self , data: dict [ str , str ] , / ) -> int :
+		"""
+		Отправка формы авторизации.
+
+		Нужны только статус ответа и cookies сессии, которые приходят в заголовках,
+		поэтому HTML-страница ответа не читается и не распаковывается: поток закрывается сразу.
+
+		Returns:
+				int: HTTP-статус ответа
+		"""
 
-		return self.xsrf
+		with self.client.stream (
+				'POST' ,
+				self._login_url ,  # URL страницы логина
+				data = data  # Данные формы авторизации
+		) as response :
+			return response.status_code
 
 	def auth ( self , login: str , password: str , / ) -> bool :
 		"""
@@ -94,6 +458,11 @@ class HHUpdater :
 		Символ / делает параметры login и password позиционными -
 		их нельзя передать по имени, только по позиции.
 
+		Если задан session_path и для логина есть актуальная сохраненная сессия, она используется
+		без обращения к серверу и без проверки пароля; после успешного входа сессия сохраняется на диск.
+		Действительность восстановленной сессии проверяет первый же запрос к HH.ru: при неудаче
+		вызывающий код должен сбросить ее через invalidate_session и повторить auth.
+
 		Args:
 				login: Логин (email) для входа в аккаунт HH.ru
 				password: Пароль для входа в аккаунт HH.ru
@@ -102,27 +471,33 @@ class HHUpdater :
 				bool: True если авторизация успешна, иначе False
 		"""
 
-		# Если XSRF-токен еще не получен, запрашиваем его
-		if not self.xsrf :
+		# Пробуем восстановить сессию прошлого запуска
+		if self.load_session ( login ) :
+			return True
+
+		# Запрашиваем XSRF-токен, только если его нет или истек срок его жизни
+		if not self._xsrf_valid ( ) :
 			self.get_xsrf ( )
 
 		# Формируем данные для отправки формы авторизации
-		data: dict [ str , str ] = {
-			'username' : login ,  # Логин пользователя
-			'password' : password ,  # Пароль пользователя
-			'backUrl'  : f"{self.base_url}/" ,  # URL для редиректа после успешного входа
-			'_xsrf'    : self.xsrf or '' ,  # XSRF-токен (защита от CSRF-атак)
-			'action'   : 'Войти'  # Текст кнопки отправки формы
-		}
+		data: dict [ str , str ] = self._login_form ( login , password )
 
-		# Отправляем POST-запрос для авторизации
-		response: httpx.Response = self.client.post (
-			f"{self.base_url}/account/login?backurl=%2F" ,  # URL страницы логина
-			data = data  # Данные формы авторизации
-		)
+		# Отправляем POST-запрос для авторизации, запоминая время попытки для ограничения частоты входов
+		self.last_login_at = time.monotonic ( )
+		status_code: int = self._post_login ( data )
+
+		# 403 означает, что сервер отклонил XSRF-токен: получаем новый и повторяем вход один раз
+		if status_code == 403 :
+			data [ '_xsrf' ] = self.get_xsrf ( ) or ''
+			status_code = self._post_login ( data )
 
 		# Авторизация считается успешной, если сервер вернул статус 200 OK
-		return response.status_code == 200
+		if status_code != 200 :
+			return False
+
+		self._logged_in ( login )
+
+		return True
 
 	def update_cv ( self , cv_id: str ) -> bool :
 		"""
@@ -142,25 +517,34 @@ class HHUpdater :
 		if not self.xsrf :
 			return False
 
-		# Формируем специальные заголовки для AJAX-запроса обновления резюме
-		headers: dict [ str , str ] = {
-			'X-Xsrftoken'      : self.xsrf ,  # XSRF-токен в заголовке (требуется HH.ru)
-			'X-Requested-With' : 'XMLHttpRequest' ,  # Указываем, что это AJAX-запрос
-			'Referer'          : f"{self.base_url}/applicant/resumes/{cv_id}"  # Страница-источник
-		}
-
-		# Данные для обновления резюме
-		data: dict [ str , str ] = {
-			'resume'       : cv_id ,  # ID обновляемого резюме
-			'undirectable' : 'true'  # Флаг, предотвращающий редирект
-		}
-
-		# Отправляем POST-запрос для "касания" (обновления времени) резюме
-		response: httpx.Response = self.client.post (
-			f"{self.base_url}/applicant/resumes/touch" ,  # Эндпоинт для обновления
-			data = data ,  # Данные с ID резюме
-			headers = headers  # Специальные заголовки с токеном
-		)
-
-		# Обновление считается успешным, если сервер вернул статус 200 OK
-		return response.status_code == 200
\ No newline at end of file
+		# Дополняем заранее собранные заголовки страницей-источником
+		headers: dict [ str , str ] = self._touch_headers ( cv_id )
+
+		# Данные для обновления резюме: заранее закодированная форма с ID резюме
+		body: bytes = _touch_body ( cv_id )
+
+		# Отправляем POST-запрос для "касания" (обновления времени) резюме.
+		# Тело ответа (около 100 байт) читается полностью: иначе при HTTP/1.1 соединение
+		# закрывается, а при HTTP/2 непрочитанные данные расходуют окно управления потоком.
+		# Ответы 429 и 5xx считаем временным сбоем и повторяем с задержкой (Retry-After или экспоненциальной)
+		for attempt in range ( TOUCH_ATTEMPTS ) :
+			response: httpx.Response = self.client.post (
+				self._touch_url ,  # Эндпоинт для обновления
+				content = body ,  # Данные с ID резюме
+				headers = headers ,  # Специальные заголовки с токеном
+				# undirectable=true отключает редиректы; если сервер все же ответит 3xx,
+				# не ходим по нему лишним запросом, а считаем обновление неудачным
+				follow_redirects = False
+			)
+
+			if not _should_retry ( response.status_code ) or attempt == TOUCH_ATTEMPTS - 1 :
+				break
+
+			time.sleep ( _retry_delay ( response.headers.get ( 'Retry-After' ) , attempt ) )
+
+		# Запоминаем, что сервер отверг сессию, чтобы вызывающий код мог выполнить вход заново
+		if _session_expired ( response.status_code ) :
+			self.session_expired = True
+
+		# Обновление считается успешным, если сервер вернул статус 2xx
+		return 200 <= response.status_code < 300
\ No newline at end of file
@@ -0,0 +1,198 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Optional , Self
+
+import httpx
+
+from .core import (
+	CLIENT_OPTIONS , TOUCH_ATTEMPTS , TRANSPORT_OPTIONS , _SessionMixin , _retry_delay , _session_expired , _should_retry ,
+	_touch_body
+)
+
+
+# noinspection GrazieInspection,SpellCheckingInspection
+class AsyncHHUpdater ( _SessionMixin ) :
+	"""
+	Асинхронный вариант HHUpdater на базе httpx.AsyncClient.
+
+	Позволяет обновлять несколько резюме параллельно (например, через asyncio.gather),
+	так что общее время работы определяется самым медленным запросом, а не их суммой.
+	Реализует асинхронный контекстный менеджер для безопасного управления HTTP-соединениями.
+	"""
+
+	# Все атрибуты экземпляра объявлены в __slots__ базового класса
+	__slots__ = ()
+
+	def __init__ ( self , base_url: str = 'https://hh.ru' , / , session_path: Optional [ Path ] = None ) -> None :
+		"""
+		Инициализация асинхронного клиента для работы с HH.ru.
+
+		Args:
+				base_url: Базовый URL HH.ru (по умолчанию 'https://hh.ru')
+								 Символ / делает параметр позиционным - его нельзя передать по имени
+				session_path: Файл для сохранения сессии между запусками, например SESSION_PATH.
+								 По умолчанию None - сессия не сохраняется и auth всегда выполняет вход
+		"""
+
+		# URL эндпоинтов, XSRF-токен и настройки сессии
+		self._init_state ( base_url , session_path )
+		# Создаем асинхронный HTTP/2-клиент: параллельные запросы идут потоками
+		# в одном соединении вместо отдельного TLS-рукопожатия на каждый запрос.
+		# Транспорт сам повторяет неудачные попытки установить соединение
+		self.client: httpx.AsyncClient = httpx.AsyncClient (
+			**CLIENT_OPTIONS ,
+			transport = httpx.AsyncHTTPTransport ( **TRANSPORT_OPTIONS )
+		)
+
+	async def __aenter__ ( self ) -> Self :
+		"""
+		Вход в асинхронный контекстный менеджер.
+
+		Returns:
+				Self: Возвращает сам экземпляр класса для использования в блоке async with
+		"""
+
+		return self
+
+	async def __aexit__ (
+			self , exc_type: Optional [ type ] , exc_val: Optional [ Exception ] , exc_tb: Optional [ object ] ) -> None :
+		"""
+		Выход из асинхронного контекстного менеджера.
+
+		Автоматически закрывает HTTP-клиент при выходе из блока async with,
+		даже если произошла ошибка.
+
+		Args:
+				exc_type: Тип исключения (если было)
+				exc_val: Экземпляр исключения (если было)
+				exc_tb: Traceback исключения (если было)
+		"""
+
+		await self.client.aclose ( )
+
+	async def get_xsrf ( self ) -> Optional [ str ] :
+		"""
+		Получение XSRF-токена со страницы логина HH.ru.
+
+		Returns:
+				Optional[str]: XSRF-токен или None, если не удалось получить
+		"""
+
+		# Запрашиваем страницу логина, где в cookies будет XSRF-токен.
+		# Cookies приходят в заголовках, поэтому тело страницы не читаем и не распаковываем
+		async with self.client.stream ( 'GET' , self._login_url ) as response :
+			# Извлекаем токен из cookies ответа
+			return self._set_xsrf ( response.cookies.get ( '_xsrf' ) )
+
+	async def _post_login ( self , data: dict [ str , str ] , / ) -> int :
+		"""
+		Отправка формы авторизации.
+
+		Нужны только статус ответа и cookies сессии, которые приходят в заголовках,
+		поэтому HTML-страница ответа не читается и не распаковывается: поток закрывается сразу.
+
+		Returns:
+				int: HTTP-статус ответа
+		"""
+
+		async with self.client.stream (
+				'POST' ,
+				self._login_url ,  # URL страницы логина
+				data = data  # Данные формы авторизации
+		) as response :
+			return response.status_code
+
+	async def auth ( self , login: str , password: str , / ) -> bool :
+		"""
+		Авторизация на HH.ru с использованием логина и пароля.
+
+		Если задан session_path и для логина есть актуальная сохраненная сессия, она используется
+		без обращения к серверу и без проверки пароля; после успешного входа сессия сохраняется на диск.
+		Действительность восстановленной сессии проверяет первый же запрос к HH.ru: при неудаче
+		вызывающий код должен сбросить ее через invalidate_session и повторить auth.
+
+		Args:
+				login: Логин (email) для входа в аккаунт HH.ru
+				password: Пароль для входа в аккаунт HH.ru
+
+		Returns:
+				bool: True если авторизация успешна, иначе False
+		"""
+
+		# Пробуем восстановить сессию прошлого запуска
+		if self.load_session ( login ) :
+			return True
+
+		# Запрашиваем XSRF-токен, только если его нет или истек срок его жизни
+		if not self._xsrf_valid ( ) :
+			await self.get_xsrf ( )
+
+		# Формируем данные для отправки формы авторизации
+		data: dict [ str , str ] = self._login_form ( login , password )
+
+		# Отправляем POST-запрос для авторизации, запоминая время попытки для ограничения частоты входов
+		self.last_login_at = time.monotonic ( )
+		status_code: int = await self._post_login ( data )
+
+		# 403 означает, что сервер отклонил XSRF-токен: получаем новый и повторяем вход один раз
+		if status_code == 403 :
+			data [ '_xsrf' ] = await self.get_xsrf ( ) or ''
+			status_code = await self._post_login ( data )
+
+		# Авторизация считается успешной, если сервер вернул статус 200 OK
+		if status_code != 200 :
+			return False
+
+		self._logged_in ( login )
+
+		return True
+
+	async def update_cv ( self , cv_id: str ) -> bool :
+		"""
+		Обновление времени последнего изменения резюме (поднятие в поиске).
+
+		Метод безопасно вызывать конкурентно для разных резюме в рамках одного клиента.
+
+		Args:
+				cv_id: ID резюме, которое нужно обновить
+
+		Returns:
+				bool: True если обновление успешно, иначе False
+		"""
+
+		# Проверяем, что у нас есть XSRF-токен (значит, мы авторизованы)
+		if not self.xsrf :
+			return False
+
+		# Дополняем заранее собранные заголовки страницей-источником
+		headers: dict [ str , str ] = self._touch_headers ( cv_id )
+
+		# Данные для обновления резюме: заранее закодированная форма с ID резюме
+		body: bytes = _touch_body ( cv_id )
+
+		# Отправляем POST-запрос для "касания" (обновления времени) резюме.
+		# Тело ответа (около 100 байт) читается полностью: иначе при HTTP/1.1 соединение
+		# закрывается, а при HTTP/2 непрочитанные данные расходуют окно управления потоком.
+		# Ответы 429 и 5xx считаем временным сбоем и повторяем с задержкой (Retry-After или экспоненциальной)
+		for attempt in range ( TOUCH_ATTEMPTS ) :
+			response: httpx.Response = await self.client.post (
+				self._touch_url ,  # Эндпоинт для обновления
+				content = body ,  # Данные с ID резюме
+				headers = headers ,  # Специальные заголовки с токеном
+				# undirectable=true отключает редиректы; если сервер все же ответит 3xx,
+				# не ходим по нему лишним запросом, а считаем обновление неудачным
+				follow_redirects = False
+			)
+
+			if not _should_retry ( response.status_code ) or attempt == TOUCH_ATTEMPTS - 1 :
+				break
+
+			await asyncio.sleep ( _retry_delay ( response.headers.get ( 'Retry-After' ) , attempt ) )
+
+		# Запоминаем, что сервер отверг сессию, чтобы вызывающий код мог выполнить вход заново
+		if _session_expired ( response.status_code ) :
+			self.session_expired = True
+
+		# Обновление считается успешным, если сервер вернул статус 2xx
+		return 200 <= response.status_code < 300
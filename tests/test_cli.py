@@ -0,0 +1,167 @@
+import asyncio
+import socket
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from hh_updater import __main__ as cli , core
+
+
+def _serve_once ( path: Path , reply: bytes ) -> list [ bytes ] :
+	"""
+	UNIX-сокет, который принимает одно соединение, читает запрос до EOF и отвечает reply.
+	"""
+
+	received: list [ bytes ] = [ ]
+	server = socket.socket ( socket.AF_UNIX , socket.SOCK_STREAM )
+	server.bind ( str ( path ) )
+	server.listen ( 1 )
+
+	def run ( ) -> None :
+		with server , server.accept ( ) [ 0 ] as conn :
+			while chunk := conn.recv ( 4096 ) :
+				received.append ( chunk )
+			conn.sendall ( reply )
+
+	threading.Thread ( target = run , daemon = True ).start ( )
+	return received
+
+
+def test_send_to_daemon_parses_replies ( tmp_path: Path ) -> None :
+	path = tmp_path / 'sock'
+	received = _serve_once ( path , b"cv2 fail\ncv1 ok\n" )
+
+	assert cli._send_to_daemon ( path , [ 'cv1' , 'cv2' , 'cv3' ] ) == [ True , False , False ]
+	assert b"".join ( received ) == b"cv1\ncv2\ncv3"
+
+
+def test_send_to_daemon_ignores_unknown_status ( tmp_path: Path ) -> None :
+	path = tmp_path / 'sock'
+	_serve_once ( path , b"cv1 maybe\n" )
+
+	assert cli._send_to_daemon ( path , [ 'cv1' ] ) == [ False ]
+
+
+def test_send_to_daemon_times_out ( tmp_path: Path , monkeypatch: pytest.MonkeyPatch ) -> None :
+	monkeypatch.setattr ( cli , 'DAEMON_TIMEOUT' , 0.1 )
+	path = tmp_path / 'sock'
+	server = socket.socket ( socket.AF_UNIX , socket.SOCK_STREAM )
+	server.bind ( str ( path ) )
+	server.listen ( 1 )
+
+	# Сервер принимает соединение, но не отвечает
+	with server , pytest.raises ( TimeoutError ) :
+		cli._send_to_daemon ( path , [ 'cv1' ] )
+
+
+def test_daemon_replies_fail_when_out_of_time ( tmp_path: Path , monkeypatch: pytest.MonkeyPatch ) -> None :
+	from hh_updater.core_async import AsyncHHUpdater
+
+	async def auth ( self: AsyncHHUpdater , login: str , password: str , / ) -> bool :
+		return True
+
+	async def touch_all ( updater: AsyncHHUpdater , cv_ids: list [ str ] ) -> list [ object ] :
+		await asyncio.sleep ( 5 )
+		return [ True ] * len ( cv_ids )
+
+	monkeypatch.setattr ( AsyncHHUpdater , 'auth' , auth )
+	monkeypatch.setattr ( cli , '_touch_all' , touch_all )
+	monkeypatch.setattr ( cli , 'DAEMON_REPLY_TIMEOUT' , 0.1 )
+	path = tmp_path / 'sock'
+
+	threading.Thread ( target = asyncio.run , args = (cli._serve ( path ) ,) , daemon = True ).start ( )
+	for _ in range ( 50 ) :
+		if path.exists ( ) :
+			break
+		time.sleep ( 0.05 )
+
+	assert cli._send_to_daemon ( path , [ 'cv1' , 'cv2' ] ) == [ False , False ]
+
+
+class _HH :
+	"""
+	Заглушка HH.ru для httpx.MockTransport: вход всегда успешен,
+	на обновление резюме отвечает статусами из очереди для его ID.
+	"""
+
+	def __init__ ( self , **touch: list [ int ] ) -> None :
+		self.touch = touch
+		self.requests: list [ httpx.Request ] = [ ]
+
+	def __call__ ( self , request: httpx.Request ) -> httpx.Response :
+		self.requests.append ( request )
+		if request.url.path == '/account/login' :
+			return httpx.Response ( 200 , headers = { 'Set-Cookie' : 'hhtoken=fresh; Domain=hh.test; Path=/' } )
+		statuses = self.touch [ parse_qs ( request.content.decode ( ) ) [ 'resume' ] [ 0 ] ]
+		return httpx.Response ( statuses.pop ( 0 ) if len ( statuses ) > 1 else statuses [ 0 ] , text = '{}' )
+
+	@property
+	def logins ( self ) -> int :
+		return sum ( 1 for request in self.requests if request.url.path == '/account/login' )
+
+
+@pytest.fixture
+def credentials ( monkeypatch: pytest.MonkeyPatch ) -> None :
+	monkeypatch.setattr ( cli , 'login' , 'user@hh.test' )
+	monkeypatch.setattr ( cli , 'password' , 'password' )
+	# Повторные попытки в тестах выполняются без ожидания
+	monkeypatch.setattr ( core , 'TOUCH_BACKOFF' , 0.0 )
+
+
+def _touch ( monkeypatch: pytest.MonkeyPatch , hh: _HH , session_path: Path | None , cv_ids: list [ str ] ) -> list [ object ] :
+	"""
+	Авторизация (из сохраненной сессии, если она есть) и обновление резюме через _touch_all.
+	"""
+
+	from hh_updater.core_async import AsyncHHUpdater
+
+	monkeypatch.setattr ( httpx , 'AsyncHTTPTransport' , lambda **_: httpx.MockTransport ( hh ) )
+
+	async def run ( ) -> list [ object ] :
+		async with AsyncHHUpdater ( 'https://hh.test' , session_path = session_path ) as updater :
+			updater._set_xsrf ( 'token' )
+			await cli._auth ( updater )
+			return await cli._touch_all ( updater , cv_ids )
+
+	return asyncio.run ( run ( ) )
+
+
+def _saved_session ( tmp_path: Path ) -> Path :
+	path = tmp_path / 'session.json'
+	cookies = httpx.Cookies ( )
+	cookies.set ( '_xsrf' , 'token' , domain = 'hh.test' )
+	cookies.set ( 'hhtoken' , 'stale' , domain = 'hh.test' )
+	core._write_session ( path , 'https://hh.test' , 'user@hh.test' , 'token' , cookies )
+	return path
+
+
+def test_touch_all_relogs_in_when_restored_session_is_rejected (
+		monkeypatch: pytest.MonkeyPatch , tmp_path: Path , credentials: None ) -> None :
+	hh = _HH ( cv1 = [ 403 , 200 ] , cv2 = [ 200 ] )
+
+	assert _touch ( monkeypatch , hh , _saved_session ( tmp_path ) , [ 'cv1' , 'cv2' ] ) == [ True , True ]
+	assert hh.logins == 1
+	# Повторяется только отклоненное резюме
+	assert len ( hh.requests ) == 4
+
+
+def test_touch_all_throttles_relogin ( monkeypatch: pytest.MonkeyPatch , credentials: None ) -> None :
+	hh = _HH ( cv1 = [ 403 , 200 ] )
+
+	# Вход по паролю только что выполнен, поэтому повторный вход не выполняется до RELOGIN_INTERVAL
+	assert _touch ( monkeypatch , hh , None , [ 'cv1' ] ) == [ False ]
+	assert hh.logins == 1
+
+
+@pytest.mark.parametrize ( 'status' , [ 404 , 500 ] )
+def test_touch_all_keeps_session_on_other_errors (
+		monkeypatch: pytest.MonkeyPatch , tmp_path: Path , credentials: None , status: int ) -> None :
+	# Чужой ID резюме или сбой сервера не означают, что сессия истекла
+	hh = _HH ( cv1 = [ status ] , cv2 = [ 200 ] )
+
+	assert _touch ( monkeypatch , hh , _saved_session ( tmp_path ) , [ 'cv1' , 'cv2' ] ) == [ False , True ]
+	assert hh.logins == 0
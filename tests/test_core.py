@@ -0,0 +1,221 @@
+import asyncio
+from typing import Callable
+
+import httpx
+import pytest
+
+from hh_updater import core
+from hh_updater.core import HHUpdater
+from hh_updater.core_async import AsyncHHUpdater
+
+Handler = Callable [ [ httpx.Request ] , httpx.Response ]
+
+
+def _responses ( *statuses: int , headers: dict [ str , str ] | None = None ) -> tuple [ list [ httpx.Request ] , Handler ] :
+	"""
+	Обработчик для httpx.MockTransport, отвечающий статусами по очереди; возвращает и список запросов.
+	"""
+
+	requests: list [ httpx.Request ] = [ ]
+	pending = list ( statuses )
+
+	def handler ( request: httpx.Request ) -> httpx.Response :
+		requests.append ( request )
+		return httpx.Response ( pending.pop ( 0 ) , headers = headers , text = '{}' )
+
+	return requests , handler
+
+
+@pytest.fixture ( autouse = True )
+def no_backoff ( monkeypatch: pytest.MonkeyPatch ) -> None :
+	# Повторные попытки в тестах выполняются без ожидания
+	monkeypatch.setattr ( core , 'TOUCH_BACKOFF' , 0.0 )
+
+
+def _updater ( monkeypatch: pytest.MonkeyPatch , handler: Handler ) -> HHUpdater :
+	monkeypatch.setattr ( httpx , 'HTTPTransport' , lambda **_: httpx.MockTransport ( handler ) )
+	updater = HHUpdater ( 'https://hh.test' )
+	updater._set_xsrf ( 'token' )
+	return updater
+
+
+def test_update_cv_retries_server_error ( monkeypatch: pytest.MonkeyPatch ) -> None :
+	requests , handler = _responses ( 502 , 503 , 200 )
+	updater = _updater ( monkeypatch , handler )
+
+	assert updater.update_cv ( 'cv1' )
+	assert len ( requests ) == 3
+	assert requests [ -1 ].content == b'resume=cv1&undirectable=true'
+	assert requests [ -1 ].headers [ 'X-Xsrftoken' ] == 'token'
+
+
+def test_update_cv_gives_up_after_attempts ( monkeypatch: pytest.MonkeyPatch ) -> None :
+	requests , handler = _responses ( *[ 500 ] * core.TOUCH_ATTEMPTS )
+	updater = _updater ( monkeypatch , handler )
+
+	assert not updater.update_cv ( 'cv1' )
+	assert len ( requests ) == core.TOUCH_ATTEMPTS
+	assert not updater.session_expired
+
+
+def test_update_cv_does_not_retry_rejected_session ( monkeypatch: pytest.MonkeyPatch ) -> None :
+	requests , handler = _responses ( 403 )
+	updater = _updater ( monkeypatch , handler )
+
+	assert not updater.update_cv ( 'cv1' )
+	assert len ( requests ) == 1
+	assert updater.session_expired
+
+
+def test_async_update_cv_retries_server_error ( monkeypatch: pytest.MonkeyPatch ) -> None :
+	requests , handler = _responses ( 500 , 200 )
+	monkeypatch.setattr ( httpx , 'AsyncHTTPTransport' , lambda **_: httpx.MockTransport ( handler ) )
+
+	async def run ( ) -> bool :
+		async with AsyncHHUpdater ( 'https://hh.test' ) as updater :
+			updater._set_xsrf ( 'token' )
+			return await updater.update_cv ( 'cv1' )
+
+	assert asyncio.run ( run ( ) )
+	assert len ( requests ) == 2
+
+
+@pytest.mark.parametrize ( 'status , retry' , [ (200 , False) , (403 , False) , (429 , True) , (500 , True) , (503 , True) ] )
+def test_should_retry ( status: int , retry: bool ) -> None :
+	assert core._should_retry ( status ) is retry
+
+
+def test_retry_delay_uses_retry_after ( ) -> None :
+	assert core._retry_delay ( '3' , 0 ) == 3.0
+
+
+def test_retry_delay_caps_retry_after ( ) -> None :
+	assert core._retry_delay ( '86400' , 0 ) == core.RETRY_AFTER_MAX
+
+
+def test_retry_delay_falls_back_to_backoff ( monkeypatch: pytest.MonkeyPatch ) -> None :
+	monkeypatch.setattr ( core , 'TOUCH_BACKOFF' , 0.5 )
+
+	# HTTP-дата вместо числа секунд не разбирается
+	assert core._retry_delay ( 'Wed, 21 Oct 2015 07:28:00 GMT' , 2 ) == 2.0
+	assert core._retry_delay ( None , 0 ) == 0.5
+
+
+def test_update_cv_waits_retry_after ( monkeypatch: pytest.MonkeyPatch ) -> None :
+	delays: list [ float ] = [ ]
+	monkeypatch.setattr ( core.time , 'sleep' , delays.append )
+	requests , handler = _responses ( 429 , 200 , headers = { 'Retry-After' : '600' } )
+	updater = _updater ( monkeypatch , handler )
+
+	assert updater.update_cv ( 'cv1' )
+	assert delays == [ core.RETRY_AFTER_MAX ]
+
+
+def test_session_round_trip ( tmp_path ) -> None :
+	path = tmp_path / 'cache' / 'session.json'
+	cookies = httpx.Cookies ( )
+	cookies.set ( '_xsrf' , 'cookie-token' , domain = '.hh.test' )
+	cookies.set ( 'hhtoken' , 'secret' , domain = '.hh.test' , path = '/account' )
+
+	core._write_session ( path , 'https://hh.test' , 'user@hh.test' , 'token' , cookies )
+
+	assert path.stat ( ).st_mode & 0o777 == 0o600
+
+	session = core._read_session ( path , 'https://hh.test' , 'user@hh.test' )
+	restored = httpx.Cookies ( )
+	assert core._restore_cookies ( session , restored ) == 'token'
+	assert restored.get ( 'hhtoken' , domain = '.hh.test' , path = '/account' ) == 'secret'
+	assert restored.get ( '_xsrf' ) == 'cookie-token'
+
+
+@pytest.mark.parametrize ( 'base_url , login' , [ ('https://hh.test' , 'other@hh.test') , ('https://hh.ru' , 'user@hh.test') ] )
+def test_read_session_rejects_other_account ( tmp_path , base_url: str , login: str ) -> None :
+	path = tmp_path / 'session.json'
+	core._write_session ( path , 'https://hh.test' , 'user@hh.test' , 'token' , httpx.Cookies ( ) )
+
+	assert core._read_session ( path , base_url , login ) is None
+
+
+def test_auth_without_session_path_always_logs_in ( monkeypatch: pytest.MonkeyPatch ) -> None :
+	requests , handler = _responses ( 200 , 200 )
+	updater = _updater ( monkeypatch , handler )
+
+	assert updater.session_path is None
+	assert updater.auth ( 'user@hh.test' , 'password' )
+	assert updater.auth ( 'user@hh.test' , 'password' )
+	assert [ request.method for request in requests ] == [ 'POST' , 'POST' ]
+
+
+def test_auth_restores_saved_session ( monkeypatch: pytest.MonkeyPatch , tmp_path ) -> None :
+	requests , handler = _responses ( 200 )
+	monkeypatch.setattr ( httpx , 'HTTPTransport' , lambda **_: httpx.MockTransport ( handler ) )
+	path = tmp_path / 'session.json'
+
+	with HHUpdater ( 'https://hh.test' , session_path = path ) as updater :
+		updater._set_xsrf ( 'token' )
+		assert updater.auth ( 'user@hh.test' , 'password' )
+
+	with HHUpdater ( 'https://hh.test' , session_path = path ) as updater :
+		assert updater.auth ( 'user@hh.test' , 'password' )
+		assert updater.session_restored
+		assert updater.xsrf == 'token'
+
+	assert len ( requests ) == 1
+
+
+@pytest.mark.parametrize ( 'content' , [ 'null' , '[]' , '"session"' , '{"base_url": "https://hh.test", "cookies": 1}' ] )
+def test_read_session_rejects_wrong_shape ( tmp_path , content: str ) -> None :
+	path = tmp_path / 'session.json'
+	path.write_text ( content )
+
+	assert core._read_session ( path , 'https://hh.test' , 'user@hh.test' ) is None
+
+
+def test_auth_logs_in_over_corrupted_session ( monkeypatch: pytest.MonkeyPatch , tmp_path ) -> None :
+	requests , handler = _responses ( 200 , 200 )
+	monkeypatch.setattr ( httpx , 'HTTPTransport' , lambda **_: httpx.MockTransport ( handler ) )
+	path = tmp_path / 'session.json'
+	path.write_text (
+		'{"base_url": "https://hh.test", "login": "user@hh.test", "xsrf": 1, "cookies": [["hhtoken", "secret"], null]}'
+	)
+
+	with HHUpdater ( 'https://hh.test' , session_path = path ) as updater :
+		# Записи неверного вида пропускаются, и без XSRF-токена выполняется обычный вход
+		assert updater.auth ( 'user@hh.test' , 'password' )
+		assert not updater.session_restored
+		assert 'hhtoken' not in updater.client.cookies
+
+	assert [ request.method for request in requests ] == [ 'GET' , 'POST' ]
+
+
+def test_needs_relogin_after_interval ( monkeypatch: pytest.MonkeyPatch ) -> None :
+	requests , handler = _responses ( 403 )
+	updater = _updater ( monkeypatch , handler )
+	updater.last_login_at = core.time.monotonic ( )
+
+	assert not updater.needs_relogin ( )
+	updater.update_cv ( 'cv1' )
+	assert not updater.needs_relogin ( )
+
+	updater.last_login_at -= core.RELOGIN_INTERVAL
+	assert updater.needs_relogin ( )
+
+
+def test_relogin_after_invalidate_session_is_single_post ( monkeypatch: pytest.MonkeyPatch , tmp_path ) -> None :
+	requests , handler = _responses ( 200 )
+	updater = _updater ( monkeypatch , handler )
+	updater.session_path = tmp_path / 'session.json'
+	updater.client.cookies.set ( '_xsrf' , 'token' , domain = 'hh.test' )
+	updater.client.cookies.set ( 'hhtoken' , 'stale' , domain = 'hh.test' )
+	updater.save_session ( 'user@hh.test' )
+
+	updater.invalidate_session ( )
+
+	assert not updater.session_path.exists ( )
+	assert updater.xsrf == 'token'
+	assert updater.client.cookies.get ( '_xsrf' ) == 'token'
+	assert 'hhtoken' not in updater.client.cookies
+
+	assert updater.auth ( 'user@hh.test' , 'password' )
+	assert [ request.method for request in requests ] == [ 'POST' ]
+	assert requests [ 0 ].headers [ 'Cookie' ] == '_xsrf=token'